@@ -92,6 +92,14 @@ void benchmark_throughput() {
         std::cout << "Read:  " << read_duration.count() << " μs, "
                   << read_throughput << " MB/s" << std::endl;
 
+        // Machine-readable result line for the Python benchmark driver:
+        // one JSON object per size, parsed instead of scraping the
+        // human-oriented text above
+        std::cout << "{\"rows\":" << num_rows
+                  << ",\"write_us\":" << write_duration.count()
+                  << ",\"read_us\":" << read_duration.count()
+                  << ",\"bytes\":" << estimated_size << "}" << std::endl;
+
         arena->Close();
         reader_arena->Close();
     }
@@ -6,25 +6,78 @@ This example demonstrates basic zero-copy data transfer between processes
 using Polars DataFrames.
 """
 
+import io
+import os
+
 import polars as pl
 import time
 import multiprocessing as mp
 from qadataswap import SharedDataFrame
 
 
-def writer_process(name: str, num_rows: int = 1000000):
+def pin_to_cpu(cpu: int):
+    """Pin the current process to one CPU core.
+
+    Writer and reader are pinned to adjacent cores so the shared-memory
+    pages move cache-to-cache over the shared L3 instead of bouncing
+    between scheduler-chosen cores. Best effort: not supported everywhere.
+    """
+    try:
+        os.sched_setaffinity(0, {cpu % os.cpu_count()})
+    except (AttributeError, OSError):
+        pass
+
+
+def aggregate_trades(df: pl.DataFrame) -> pl.DataFrame:
+    """Filter/group/aggregate the trade frame, on GPU when cuDF is present.
+
+    The shared buffers are already Arrow, so the hop to device memory is a
+    single Arrow transfer. Falls back to the Polars lazy streaming engine
+    when cuDF is not installed or GPU setup fails.
+    """
+    try:
+        import cudf
+
+        gdf = cudf.DataFrame.from_arrow(df.to_arrow())
+        grouped = (gdf[gdf["price"] > 500]
+                   .groupby("symbol")
+                   .agg({"volume": "sum", "price": "mean", "id": "count"})
+                   .reset_index())
+        grouped.columns = ["symbol", "total_volume", "avg_price", "count"]
+        return pl.from_arrow(grouped.to_arrow()).sort("total_volume", descending=True)
+    except Exception:
+        return (df.lazy()
+                .filter(pl.col("price") > 500)
+                .group_by("symbol")
+                .agg([
+                    pl.col("volume").sum().alias("total_volume"),
+                    pl.col("price").mean().alias("avg_price"),
+                    pl.col("id").count().alias("count")
+                ])
+                .sort("total_volume", descending=True)
+                .collect(streaming=True))
+
+
+def writer_process(name: str, num_rows: int = 1000000, ready=None):
     """Writer process that generates and writes data"""
+    pin_to_cpu(0)
     print(f"Writer: Starting with {num_rows} rows")
 
-    # Create writer
+    # Create writer and signal readers that the segment exists
     writer = SharedDataFrame.create_writer(name, size_mb=100)
+    if ready is not None:
+        ready.set()
 
-    # Generate test data
+    # Generate test data; price/volume are quantized to 32-bit on the
+    # wire, which halves their footprint in the shared segment without
+    # losing precision at these value ranges
     df = pl.DataFrame({
         "id": pl.arange(0, num_rows, eager=True),
-        "price": pl.arange(0, num_rows, eager=True).cast(pl.Float64) * 1.5 + 100.0,
-        "volume": pl.arange(0, num_rows, eager=True) * 10,
-        "symbol": ["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"] * (num_rows // 5),
+        "price": (pl.arange(0, num_rows, eager=True).cast(pl.Float64) * 1.5 + 100.0).cast(pl.Float32),
+        "volume": (pl.arange(0, num_rows, eager=True) * 10).cast(pl.Int32),
+        "symbol": pl.Series(
+            "symbol", ["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"], dtype=pl.Categorical
+        ).gather(pl.arange(0, num_rows, eager=True) % 5),
     })
 
     print(f"Writer: Generated DataFrame with shape {df.shape}")
@@ -38,20 +91,24 @@ def writer_process(name: str, num_rows: int = 1000000):
 
     print(f"Writer: Data written in {write_time:.4f} seconds")
 
-    # Get statistics
-    stats = writer.get_stats()
-    print(f"Writer: Statistics: {stats}")
+    # Stats cross the binding as a fresh dict per call; only build it
+    # when debugging is on
+    if os.environ.get("QADATASWAP_DEBUG"):
+        print(f"Writer: Statistics: {writer.get_stats()}")
 
     writer.close()
     print("Writer: Finished")
 
 
-def reader_process(name: str, expected_rows: int = 1000000):
+def reader_process(name: str, expected_rows: int = 1000000, ready=None):
     """Reader process that reads and verifies data"""
+    pin_to_cpu(1)
     print("Reader: Starting")
 
-    # Wait a bit for writer to initialize
-    time.sleep(0.5)
+    # Block until the writer has actually created the segment instead of
+    # guessing with a fixed sleep
+    if ready is not None:
+        ready.wait(timeout=10)
 
     # Create reader
     reader = SharedDataFrame.create_reader(name)
@@ -66,32 +123,25 @@ def reader_process(name: str, expected_rows: int = 1000000):
         return
 
     print(f"Reader: Data read in {read_time:.4f} seconds")
-    print(f"Reader: Received DataFrame with shape {df.shape}")
+
+    # Read the shape once; height/width go through the binding each access
+    rows, cols = df.shape
+    print(f"Reader: Received DataFrame with shape ({rows}, {cols})")
 
     # Verify data integrity
-    assert df.height == expected_rows, f"Expected {expected_rows} rows, got {df.height}"
-    assert df.width == 5, f"Expected 5 columns, got {df.width}"
+    assert rows == expected_rows, f"Expected {expected_rows} rows, got {rows}"
+    assert cols == 4, f"Expected 4 columns, got {cols}"
 
     print("Reader: Sample data:")
     print(df.head())
 
-    # Perform some operations
-    result = (df
-              .filter(pl.col("price") > 500)
-              .group_by("symbol")
-              .agg([
-                  pl.col("volume").sum().alias("total_volume"),
-                  pl.col("price").mean().alias("avg_price"),
-                  pl.col("id").count().alias("count")
-              ])
-              .sort("total_volume", descending=True))
+    result = aggregate_trades(df)
 
     print("Reader: Aggregation result:")
     print(result)
 
-    # Get statistics
-    stats = reader.get_stats()
-    print(f"Reader: Statistics: {stats}")
+    if os.environ.get("QADATASWAP_DEBUG"):
+        print(f"Reader: Statistics: {reader.get_stats()}")
 
     reader.close()
     print("Reader: Finished")
@@ -112,22 +162,22 @@ def benchmark_comparison():
     # QADataSwap method
     print("Testing QADataSwap (zero-copy)...")
 
-    def qads_write():
-        writer = SharedDataFrame.create_writer("benchmark", size_mb=50)
-        start = time.time()
-        writer.write(df)
-        return time.time() - start
+    # Keep one writer/reader session open for the whole benchmark so
+    # segment creation and attach cost stay out of the timed region
+    writer = SharedDataFrame.create_writer("benchmark", size_mb=50)
+    reader = SharedDataFrame.create_reader("benchmark")
 
-    def qads_read():
-        time.sleep(0.1)  # Ensure writer is ready
-        reader = SharedDataFrame.create_reader("benchmark")
-        start = time.time()
-        result = reader.read(timeout_ms=5000)
-        elapsed = time.time() - start
-        return elapsed, result.height if result else 0
+    start = time.time()
+    writer.write(df)
+    write_time = time.time() - start
 
-    write_time = qads_write()
-    read_time, rows_read = qads_read()
+    start = time.time()
+    result = reader.read(timeout_ms=5000)
+    read_time = time.time() - start
+    rows_read = result.height if result is not None else 0
+
+    reader.close()
+    writer.close()
 
     print(f"QADataSwap write: {write_time:.4f}s")
     print(f"QADataSwap read:  {read_time:.4f}s ({rows_read} rows)")
@@ -135,12 +185,17 @@ def benchmark_comparison():
     # Traditional method (serialization)
     print("\nTesting traditional serialization...")
 
+    # Reuse one in-memory buffer for the round-trip instead of letting
+    # write_ipc allocate a fresh one and copying it back out
+    ipc_buffer = io.BytesIO()
+
     start = time.time()
-    serialized = df.write_ipc(None)
+    df.write_ipc(ipc_buffer)
     serialize_time = time.time() - start
 
+    ipc_buffer.seek(0)
     start = time.time()
-    df_restored = pl.read_ipc(serialized)
+    df_restored = pl.read_ipc(ipc_buffer)
     deserialize_time = time.time() - start
 
     print(f"Serialize:   {serialize_time:.4f}s")
@@ -148,7 +203,7 @@ def benchmark_comparison():
 
     # Memory usage comparison
     memory_original = df.estimated_size("mb")
-    memory_serialized = len(serialized) / 1024 / 1024
+    memory_serialized = ipc_buffer.getbuffer().nbytes / 1024 / 1024
 
     print(f"\nMemory usage:")
     print(f"Original DataFrame: {memory_original:.2f} MB")
@@ -174,9 +229,17 @@ def main():
     shared_name = "basic_example"
     num_rows = 1000000
 
-    # Start writer and reader processes
-    writer_proc = mp.Process(target=writer_process, args=(shared_name, num_rows))
-    reader_proc = mp.Process(target=reader_process, args=(shared_name, num_rows))
+    # Fork (rather than spawn) so children inherit the already-imported
+    # polars/qadataswap modules instead of re-importing them; the shared
+    # segment itself is attached by name, so no fd handoff is needed
+    try:
+        ctx = mp.get_context("fork")
+    except ValueError:  # platforms without fork (e.g. Windows)
+        ctx = mp.get_context()
+
+    writer_ready = ctx.Event()
+    writer_proc = ctx.Process(target=writer_process, args=(shared_name, num_rows, writer_ready))
+    reader_proc = ctx.Process(target=reader_process, args=(shared_name, num_rows, writer_ready))
 
     print("Starting writer and reader processes...")
     writer_proc.start()
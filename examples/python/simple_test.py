@@ -66,10 +66,13 @@ def test_multiprocess():
     """测试多进程"""
     import multiprocessing as mp
 
+    writer_ready = mp.Event()
+
     def writer_func():
         try:
             import qadataswap
             writer = qadataswap.SimpleSharedMemory.create_writer("test_mp", size_mb=5)
+            writer_ready.set()
 
             for i in range(5):
                 data = f"Message {i}: {time.time()}".encode()
@@ -85,7 +88,7 @@ def test_multiprocess():
     def reader_func():
         try:
             import qadataswap
-            time.sleep(0.2)  # Wait for writer to initialize
+            writer_ready.wait(timeout=5)  # Wait for writer to initialize
             reader = qadataswap.SimpleSharedMemory.create_reader("test_mp")
 
             for i in range(5):
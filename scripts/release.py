@@ -12,22 +12,51 @@ This script automates the release process including:
 import os
 import sys
 import subprocess
+import threading
 import argparse
 from pathlib import Path
 import re
 
 def run_command(cmd, check=True, cwd=None):
-    """Run a command and return the result."""
+    """Run a command, streaming its output line by line.
+
+    Long steps (builds, uploads) show progress immediately instead of
+    buffering everything in memory until the process exits. stdout and
+    stderr stay on separate pipes: the cleanliness gate in
+    git_operations requires an *empty* porcelain stdout, so a stray git
+    warning on stderr must not leak into it.
+    """
     print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=cwd)
+    process = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, text=True, cwd=cwd)
 
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
+    stderr_lines = []
 
-    if check and result.returncode != 0:
-        sys.exit(result.returncode)
+    def stream_stderr():
+        for line in process.stderr:
+            print(line, end="", file=sys.stderr)
+            stderr_lines.append(line)
+
+    # Drain stderr on a side thread so neither pipe can fill up and
+    # block the child while we stream the other one
+    stderr_thread = threading.Thread(target=stream_stderr)
+    stderr_thread.start()
+
+    stdout_lines = []
+    for line in process.stdout:
+        print(line, end="")
+        stdout_lines.append(line)
+    stderr_thread.join()
+    process.stdout.close()
+    process.stderr.close()
+    returncode = process.wait()
+
+    result = subprocess.CompletedProcess(cmd, returncode,
+                                         "".join(stdout_lines),
+                                         "".join(stderr_lines))
+
+    if check and returncode != 0:
+        sys.exit(returncode)
 
     return result
 
@@ -109,12 +138,13 @@ def git_operations(version):
         print("Working directory is not clean. Please commit or stash changes.")
         sys.exit(1)
 
-    # Add and commit version changes
-    run_command("git add src/python/qadataswap/__init__.py CHANGELOG.md")
-    run_command(f'git commit -m "Bump version to {version}"')
-
-    # Create tag
-    run_command(f'git tag -a v{version} -m "Release version {version}"')
+    # Add, commit and tag in one shell so git starts up once instead of
+    # three times; && keeps the chain atomic — a failed commit never tags
+    run_command(
+        "git add src/python/qadataswap/__init__.py CHANGELOG.md"
+        f' && git commit -m "Bump version to {version}"'
+        f' && git tag -a v{version} -m "Release version {version}"'
+    )
 
     print(f"Created git tag v{version}")
 
@@ -133,11 +133,18 @@ private:
     size_t GetNextWriteBuffer();
     size_t GetCurrentReadBuffer();
 
+    arrow::Status WaitAndConsumeReadToken(int timeout_ms);
+
     arrow::Status SerializeRecordBatch(const std::shared_ptr<arrow::RecordBatch>& batch,
                                       uint8_t* buffer, size_t buffer_size, size_t* out_size);
     arrow::Result<std::shared_ptr<arrow::RecordBatch>> DeserializeRecordBatch(
         const uint8_t* buffer, size_t size);
 
+    arrow::Status SerializeTable(const std::shared_ptr<arrow::Table>& table,
+                                uint8_t* buffer, size_t buffer_size, size_t* out_size);
+    arrow::Result<std::shared_ptr<arrow::Table>> DeserializeTable(
+        const uint8_t* buffer, size_t size);
+
     arrow::Status SerializeSchema(const std::shared_ptr<arrow::Schema>& schema,
                                  uint8_t* buffer, size_t buffer_size, size_t* out_size);
     arrow::Result<std::shared_ptr<arrow::Schema>> DeserializeSchema(
@@ -12,17 +12,26 @@ import shutil
 from pathlib import Path
 
 def run_command(cmd, check=True):
-    """Run a command and print output."""
+    """Run a command, streaming its output line by line.
+
+    Compilation output appears as it happens rather than after the whole
+    build finishes, and nothing accumulates beyond what is printed.
+    """
     print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    process = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True)
+
+    output_lines = []
+    for line in process.stdout:
+        print(line, end="")
+        output_lines.append(line)
+    process.stdout.close()
+    returncode = process.wait()
 
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
+    result = subprocess.CompletedProcess(cmd, returncode, "".join(output_lines), "")
 
-    if check and result.returncode != 0:
-        sys.exit(result.returncode)
+    if check and returncode != 0:
+        sys.exit(returncode)
 
     return result
 
@@ -30,15 +39,20 @@ def clean_build():
     """Clean previous build artifacts."""
     print("Cleaning build artifacts...")
 
-    dirs_to_clean = ["build", "dist", "*.egg-info", "qadataswap/*.so"]
-    for pattern in dirs_to_clean:
-        for path in Path(".").glob(pattern):
-            if path.is_dir():
-                shutil.rmtree(path)
-                print(f"Removed directory: {path}")
-            else:
-                path.unlink()
-                print(f"Removed file: {path}")
+    # Enumerate all targets in one pass, then remove them in a batch;
+    # fixed names are checked directly instead of glob-scanning for them
+    root = Path(".")
+    targets = [root / name for name in ("build", "dist") if (root / name).exists()]
+    targets += root.glob("*.egg-info")
+    targets += (root / "qadataswap").glob("*.so")
+
+    for path in targets:
+        if path.is_dir():
+            shutil.rmtree(path)
+            print(f"Removed directory: {path}")
+        else:
+            path.unlink()
+            print(f"Removed file: {path}")
 
 def build_sdist():
     """Build source distribution."""
@@ -26,8 +26,15 @@ public:
     }
 
     py::object write_polars_dataframe(py::object polars_df) {
-        // Convert Polars DataFrame to Arrow Table
-        py::object arrow_table = polars_df.attr("to_arrow")();
+        // Accept pa.Table / pa.RecordBatch directly: callers that already
+        // hold Arrow data (e.g. from pa.ipc.open_stream) skip the
+        // to_arrow() traversal of every column buffer
+        py::object arrow_table = polars_df;
+        if (!arrow::py::is_table(arrow_table.ptr()) &&
+            !arrow::py::is_batch(arrow_table.ptr())) {
+            // Convert Polars DataFrame to Arrow Table
+            arrow_table = polars_df.attr("to_arrow")();
+        }
 
         // Get the underlying Arrow Table
         auto cpp_table = unwrap_table(arrow_table.ptr());
@@ -35,13 +42,16 @@ public:
             throw std::runtime_error("Failed to unwrap Arrow table");
         }
 
-        // Convert to RecordBatch
-        auto batches = cpp_table.ValueOrDie()->CombineChunksToBatch();
-        if (!batches.ok()) {
-            throw std::runtime_error("Failed to combine chunks to batch");
+        // WriteTable streams the table chunk-by-chunk into the shared
+        // buffer, so chunked columns are not flattened into an extra
+        // contiguous copy first
+        arrow::Status status;
+        {
+            // Pure C++ from here on; drop the GIL so a reader thread
+            // blocked in read() can make progress concurrently
+            py::gil_scoped_release release;
+            status = arena_->WriteTable(cpp_table.ValueOrDie());
         }
-
-        auto status = arena_->WriteRecordBatch(batches.ValueOrDie());
         if (!status.ok()) {
             throw std::runtime_error("Failed to write: " + status.ToString());
         }
@@ -55,7 +65,11 @@ public:
             throw std::runtime_error("Failed to unwrap Arrow table");
         }
 
-        auto status = arena_->WriteTable(cpp_table.ValueOrDie());
+        arrow::Status status;
+        {
+            py::gil_scoped_release release;
+            status = arena_->WriteTable(cpp_table.ValueOrDie());
+        }
         if (!status.ok()) {
             throw std::runtime_error("Failed to write: " + status.ToString());
         }
@@ -64,7 +78,13 @@ public:
     }
 
     py::object read_as_polars_dataframe(int timeout_ms = -1) {
-        auto result = arena_->ReadRecordBatch(timeout_ms);
+        // ReadTable blocks in sem_timedwait for up to timeout_ms; holding
+        // the GIL across that wait would starve the writer thread
+        arrow::Result<std::shared_ptr<arrow::Table>> result;
+        {
+            py::gil_scoped_release release;
+            result = arena_->ReadTable(timeout_ms);
+        }
         if (!result.ok()) {
             if (result.status().IsIOError() && result.status().message().find("Timeout") != std::string::npos) {
                 return py::none(); // Return None for timeout
@@ -72,14 +92,8 @@ public:
             throw std::runtime_error("Failed to read: " + result.status().ToString());
         }
 
-        auto batch = result.ValueOrDie();
-        auto table = arrow::Table::FromRecordBatches({batch});
-        if (!table.ok()) {
-            throw std::runtime_error("Failed to create table from batch");
-        }
-
         // Convert to PyArrow Table
-        auto py_table = wrap_table(table.ValueOrDie());
+        auto py_table = wrap_table(result.ValueOrDie());
         if (!py_table) {
             throw std::runtime_error("Failed to wrap table");
         }
@@ -92,7 +106,11 @@ public:
     }
 
     py::object read_as_pyarrow_table(int timeout_ms = -1) {
-        auto result = arena_->ReadTable(timeout_ms);
+        arrow::Result<std::shared_ptr<arrow::Table>> result;
+        {
+            py::gil_scoped_release release;
+            result = arena_->ReadTable(timeout_ms);
+        }
         if (!result.ok()) {
             if (result.status().IsIOError() && result.status().message().find("Timeout") != std::string::npos) {
                 return py::none();
@@ -109,6 +127,7 @@ public:
     }
 
     bool wait_for_data(int timeout_ms = -1) {
+        py::gil_scoped_release release;
         auto status = arena_->WaitForData(timeout_ms);
         return status.ok();
     }
@@ -154,8 +173,13 @@ private:
     std::unique_ptr<SharedMemoryArena> arena_;
 
     arrow::Result<std::shared_ptr<arrow::Table>> unwrap_table(PyObject* obj) {
+        if (arrow::py::is_batch(obj)) {
+            // Wrapping a batch in a table shares its buffers; no copy
+            ARROW_ASSIGN_OR_RAISE(auto batch, arrow::py::unwrap_batch(obj));
+            return arrow::Table::FromRecordBatches({batch});
+        }
         if (!arrow::py::is_table(obj)) {
-            return arrow::Status::TypeError("Object is not an Arrow Table");
+            return arrow::Status::TypeError("Object is not an Arrow Table or RecordBatch");
         }
         return arrow::py::unwrap_table(obj);
     }
@@ -184,9 +208,9 @@ PYBIND11_MODULE(qadataswap, m) {
                    static_cast<std::shared_ptr<qadataswap::SharedDataFrame>(*)(const std::string&)>(&qadataswap::SharedDataFrame::create_reader),
                    py::arg("name"))
         .def("write", &qadataswap::SharedDataFrame::write_polars_dataframe,
-             "Write a Polars DataFrame with zero-copy")
+             "Write a Polars DataFrame (or PyArrow Table/RecordBatch) with zero-copy")
         .def("write_arrow", &qadataswap::SharedDataFrame::write_pyarrow_table,
-             "Write a PyArrow Table with zero-copy")
+             "Write a PyArrow Table or RecordBatch with zero-copy")
         .def("read", &qadataswap::SharedDataFrame::read_as_polars_dataframe,
              py::arg("timeout_ms") = -1, "Read as Polars DataFrame with zero-copy")
         .def("read_arrow", &qadataswap::SharedDataFrame::read_as_pyarrow_table,
@@ -12,9 +12,16 @@ import argparse
 from pathlib import Path
 
 def run_command(cmd, check=True):
-    """Run a command and return the result."""
-    print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    """Run an argv list and return the result.
+
+    The command is executed directly rather than through a shell: one
+    exec instead of shell parse + double exec, which also lets the
+    runtime launch the child via posix_spawn. close_fds=False skips the
+    close-every-descriptor loop; these are trusted build tools.
+    """
+    print(f"Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd, capture_output=True, text=True,
+                            close_fds=False, env=os.environ)
 
     if result.stdout:
         print(result.stdout)
@@ -35,7 +42,11 @@ def check_dependencies():
         print(f"✓ twine version: {twine.__version__}")
     except ImportError:
         print("✗ twine not found. Installing...")
-        run_command("python -m pip install twine")
+        run_command([sys.executable, "-m", "pip", "install", "twine"])
+
+def dist_files():
+    """Expand dist/* in Python; commands no longer go through a shell."""
+    return [str(p) for p in sorted(Path("dist").iterdir())]
 
 def check_files():
     """Check if distribution files exist."""
@@ -77,8 +88,8 @@ def upload_to_test_pypi():
     """Upload to Test PyPI."""
     print("Uploading to Test PyPI...")
 
-    cmd = "python -m twine upload --repository testpypi dist/*"
-    run_command(cmd)
+    cmd = [sys.executable, "-m", "twine", "upload", "--repository", "testpypi"]
+    run_command(cmd + dist_files())
 
     print("\n" + "="*50)
     print("✓ Upload to Test PyPI completed!")
@@ -97,8 +108,8 @@ def upload_to_pypi():
         print("Upload cancelled.")
         return
 
-    cmd = "python -m twine upload dist/*"
-    run_command(cmd)
+    cmd = [sys.executable, "-m", "twine", "upload"]
+    run_command(cmd + dist_files())
 
     print("\n" + "="*50)
     print("✓ Upload to PyPI completed!")
@@ -110,7 +121,7 @@ def upload_to_pypi():
 def check_package():
     """Check package with twine."""
     print("Checking package with twine...")
-    run_command("python -m twine check dist/*")
+    run_command([sys.executable, "-m", "twine", "check"] + dist_files())
 
 def main():
     """Main upload process."""
@@ -5,10 +5,13 @@ QADataSwap 跨语言集成测试
 """
 
 import os
+import selectors
 import sys
+import threading
 import subprocess
 import time
 import signal
+from concurrent.futures import ThreadPoolExecutor
 import polars as pl
 from pathlib import Path
 
@@ -31,39 +34,92 @@ class CrossLanguageTest:
 
     def check_executables(self):
         """检查所有可执行文件是否存在"""
-        cpp_files = ['cpp_writer', 'cpp_reader']
-        rust_files = ['rust_writer', 'rust_reader']
-
         print("检查可执行文件...")
 
-        for exe in cpp_files:
-            path = self.cpp_examples / exe
-            if not path.exists():
-                print(f"❌ 未找到 C++ 可执行文件: {path}")
-                return False
-            print(f"✅ 找到 C++ 可执行文件: {exe}")
-
-        for exe in rust_files:
-            path = self.rust_examples / exe
-            if not path.exists():
-                print(f"❌ 未找到 Rust 可执行文件: {path}")
-                return False
-            print(f"✅ 找到 Rust 可执行文件: {exe}")
+        # 每个目录只scandir一次, 用集合判成员; 不再逐文件stat
+        checks = [
+            ("C++", self.cpp_examples, ['cpp_writer', 'cpp_reader']),
+            ("Rust", self.rust_examples, ['rust_writer', 'rust_reader']),
+        ]
+        for label, directory, names in checks:
+            try:
+                present = {e.name for e in os.scandir(directory) if e.is_file()}
+            except FileNotFoundError:
+                present = set()
+            for exe in names:
+                if exe not in present:
+                    print(f"❌ 未找到 {label} 可执行文件: {directory / exe}")
+                    return False
+                print(f"✅ 找到 {label} 可执行文件: {exe}")
 
         print("✅ 所有可执行文件检查完成\n")
         return True
 
+    def _wait_for_output(self, proc, token, timeout=10):
+        """扫描子进程stdout, 直到出现含token的完整行 (代替固定sleep同步).
+
+        proc 需要以 stdout=PIPE 启动. 直接非阻塞读原始fd并自行按行
+        切分: select不能和带缓冲的文件对象混用 — 一次readline会把
+        整个突发(可能含token)吞进Python缓冲, 只返回第一行, 之后
+        select在已经读空的fd上干等到超时. 原始fd读不经过缓冲,
+        子进程"突发后安静"也能立即命中. 看到token返回True,
+        子进程退出(EOF)或超时返回False.
+        """
+        fd = proc.stdout.fileno()
+        os.set_blocking(fd, False)
+        sel = selectors.DefaultSelector()
+        sel.register(fd, selectors.EVENT_READ)
+        deadline = time.monotonic() + timeout
+        token_bytes = token.encode()
+        pending = b""
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not sel.select(timeout=remaining):
+                    return False
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:  # EOF: 子进程已退出
+                    return False
+                pending += chunk
+                # 只在完整行里找token, 半行留到下一块拼上再判,
+                # 避免token恰好被分包截断时漏判
+                complete, _, pending = pending.rpartition(b"\n")
+                if token_bytes in complete:
+                    return True
+        finally:
+            sel.unregister(fd)
+            sel.close()
+            os.set_blocking(fd, True)
+
+    def _drain_output(self, proc):
+        """token之后的输出不再需要: 用守护线程持续排空stdout.
+
+        不排空的话, 子进程写满64KB管道缓冲后会阻塞在print上,
+        长时间运行的写入器会被测试挂住."""
+        def _drain():
+            try:
+                for _ in proc.stdout:
+                    pass
+            except (ValueError, OSError):
+                pass
+        threading.Thread(target=_drain, daemon=True).start()
+
     def test_python_to_cpp(self):
         """测试 Python -> C++ 数据传输"""
         print("🔄 测试 Python -> C++ 数据传输")
 
         try:
             # Python 写入数据
+            # 向量化构建, 避免Python循环逐元素生成
+            index = pl.arange(0, 1000, eager=True)
             df = pl.DataFrame({
-                'timestamp': [1234567890 + i for i in range(1000)],
-                'symbol': ['AAPL'] * 1000,
-                'price': [100.0 + i * 0.1 for i in range(1000)],
-                'volume': [1000 + i for i in range(1000)]
+                'timestamp': index + 1234567890,
+                'symbol': pl.repeat('AAPL', 1000, eager=True),
+                'price': index.cast(pl.Float64) * 0.1 + 100.0,
+                'volume': index + 1000
             })
 
             print("  📝 Python 创建数据...")
@@ -71,51 +127,31 @@ class CrossLanguageTest:
             writer.write_arrow(df.to_arrow())
             print("  ✅ Python 数据写入完成")
 
-            # 启动 C++ 读取器并让它在后台运行
+            # 启动 C++ 读取器并逐行扫描它的输出
             print("  📖 启动 C++ 读取器...")
             cpp_reader_process = subprocess.Popen([
                 str(self.cpp_examples / 'cpp_reader'),
                 self.test_name + "_py_to_cpp"
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-            # 等待一段时间让C++读取器处理第一批数据
-            print("  ⏳ 等待 C++ 读取器处理数据...")
-            import time
-            time.sleep(3)  # 给足够时间处理第一批数据
-
-            # 检查进程是否还在运行
-            if cpp_reader_process.poll() is None:
-                # 进程仍在运行，说明它在等待更多数据，这是正常的
-                print("  ✅ C++ 读取器正在处理数据...")
-                
-                # 等待一小段时间后终止进程
-                time.sleep(2)
-                cpp_reader_process.terminate()
-                
-                try:
-                    stdout, stderr = cpp_reader_process.communicate(timeout=5)
-                except subprocess.TimeoutExpired:
-                    cpp_reader_process.kill()
-                    stdout, stderr = cpp_reader_process.communicate()
-                
-                # 检查输出中是否有成功读取的证据
-                if "Reader attached successfully" in stdout and "Batch 1 received" in stdout:
-                    print("  ✅ C++ 成功读取 Python 数据")
-                    print(f"  📊 C++ 读取到数据并处理成功")
-                    return True
-                else:
-                    print(f"  ❌ C++ 读取不完整:")
-                    print(f"    stdout: {stdout[:500]}...")
-                    return False
+            ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+
+            # 逐行读stdout, 看到第一批数据的成功标记就立即判定通过;
+            # 不再固定sleep + communicate()整流缓冲, 检测延迟从秒级
+            # 降到行级, 长时间运行的读取器输出也不会在内存里堆积
+            success = self._wait_for_output(cpp_reader_process, "Batch 1 received")
+
+            cpp_reader_process.terminate()
+            try:
+                cpp_reader_process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                cpp_reader_process.kill()
+                cpp_reader_process.wait()
+
+            if success:
+                print("  ✅ C++ 成功读取 Python 数据")
+                return True
             else:
-                # 进程已经结束
-                stdout, stderr = cpp_reader_process.communicate()
-                if cpp_reader_process.returncode == 0:
-                    print("  ✅ C++ 成功读取 Python 数据")
-                    return True
-                else:
-                    print(f"  ❌ C++ 读取失败: {stderr}")
-                    return False
+                print("  ❌ C++ 未读到第一批数据")
+                return False
 
         except Exception as e:
             print(f"  ❌ Python -> C++ 测试失败: {e}")
@@ -137,10 +173,14 @@ class CrossLanguageTest:
             cpp_writer = subprocess.Popen([
                 str(self.cpp_examples / 'cpp_writer'),
                 self.test_name + "_cpp_to_py"
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
 
-            # 等待数据写入
-            time.sleep(2)
+            # 等写入器真正写出第一批数据, 不再按固定秒数猜
+            if not self._wait_for_output(cpp_writer, "Batch 1 written"):
+                print("  ❌ C++ 写入器未产出数据")
+                cpp_writer.terminate()
+                return False
+            self._drain_output(cpp_writer)
 
             # Python 读取数据
             print("  📖 Python 读取数据...")
@@ -172,10 +212,11 @@ class CrossLanguageTest:
 
         try:
             # Python 写入数据
+            index = pl.arange(0, 500, eager=True)
             df = pl.DataFrame({
-                'id': list(range(500)),
-                'value': [i * 2.5 for i in range(500)],
-                'category': [f'cat_{i % 5}' for i in range(500)]
+                'id': index,
+                'value': index.cast(pl.Float64) * 2.5,
+                'category': pl.Series([f'cat_{i}' for i in range(5)]).gather(index % 5)
             })
 
             print("  📝 Python 创建数据...")
@@ -211,10 +252,14 @@ class CrossLanguageTest:
             rust_writer = subprocess.Popen([
                 str(self.rust_examples / 'rust_writer'),
                 self.test_name + "_rust_to_py"
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
 
-            # 等待数据写入
-            time.sleep(3)
+            # 等写入器真正写出第一批数据, 不再按固定秒数猜
+            if not self._wait_for_output(rust_writer, "Batch 1 written"):
+                print("  ❌ Rust 写入器未产出数据")
+                rust_writer.terminate()
+                return False
+            self._drain_output(rust_writer)
 
             # Python 读取数据
             print("  📖 Python 读取数据...")
@@ -250,10 +295,14 @@ class CrossLanguageTest:
             cpp_writer = subprocess.Popen([
                 str(self.cpp_examples / 'cpp_writer'),
                 self.test_name + "_cpp_to_rust"
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
 
-            # 等待数据写入
-            time.sleep(2)
+            # 等写入器真正写出第一批数据, 不再按固定秒数猜
+            if not self._wait_for_output(cpp_writer, "Batch 1 written"):
+                print("  ❌ C++ 写入器未产出数据")
+                cpp_writer.terminate()
+                return False
+            self._drain_output(cpp_writer)
 
             # Rust 读取数据
             print("  📖 启动 Rust 读取器...")
@@ -299,18 +348,19 @@ class CrossLanguageTest:
 
         results = []
 
-        for test_name, test_func in tests:
-            print(f"\n{'=' * 60}")
-            try:
-                result = test_func()
-                results.append((test_name, result))
-                print(f"📊 {test_name}: {'✅ 通过' if result else '❌ 失败'}")
-            except Exception as e:
-                print(f"📊 {test_name}: ❌ 异常 - {e}")
-                results.append((test_name, False))
-
-            # 清理共享内存
-            time.sleep(1)
+        # 五个方向各用独立命名的共享内存段, 互不共享资源; 并发执行让
+        # 各测试等子进程的I/O空闲互相重叠, 总耗时收敛到最慢的单项,
+        # 也不再需要测试之间的固定sleep
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [(name, executor.submit(func)) for name, func in tests]
+            for test_name, future in futures:
+                try:
+                    result = future.result()
+                    results.append((test_name, result))
+                    print(f"📊 {test_name}: {'✅ 通过' if result else '❌ 失败'}")
+                except Exception as e:
+                    print(f"📊 {test_name}: ❌ 异常 - {e}")
+                    results.append((test_name, False))
 
         # 总结
         print(f"\n{'=' * 60}")
@@ -9,7 +9,8 @@ import sys
 import subprocess
 import time
 import json
-import psutil
+import numpy as np
+import resource
 from pathlib import Path
 import polars as pl
 
@@ -27,63 +28,97 @@ class PerformanceBenchmark:
         self.cpp_examples = self.project_root / 'build' / 'cpp' / 'examples' / 'cpp'
         self.rust_examples = self.project_root / 'examples' / 'rust' / 'target' / 'release'
         self.results = {}
+        self._test_data = None
 
     def create_test_data(self, rows=10000):
-        """创建测试数据"""
-        return pl.DataFrame({
-            'timestamp': [1640995200 + i for i in range(rows)],  # 2022-01-01 开始
-            'symbol': ['AAPL', 'MSFT', 'GOOGL', 'TSLA', 'NVDA'][i % 5] for i in range(rows),
-            'price': [100.0 + (i % 1000) * 0.01 for i in range(rows)],
-            'volume': [1000 + (i % 10000) for i in range(rows)],
-            'bid': [99.99 + (i % 1000) * 0.01 for i in range(rows)],
-            'ask': [100.01 + (i % 1000) * 0.01 for i in range(rows)]
-        })
+        """创建测试数据 (numpy向量化构建, 不走逐行Python循环).
+
+        各基准阶段反复要同一批确定性数据, 只在首次(或要求更大规模时)
+        真正构建; 小规模直接head切片, Arrow列零拷贝共享同一份缓冲
+        """
+        if self._test_data is None or self._test_data.height < rows:
+            idx = np.arange(rows, dtype=np.int64)
+            cents = (idx % 1000) * 0.01
+            # Categorical → Arrow字典数组: 5个符号字符串只存一份字典,
+            # 每行只剩一个小整数索引, IPC传输的字节数随之等比例减少
+            symbols = pl.Series('symbol', ['AAPL', 'MSFT', 'GOOGL', 'TSLA', 'NVDA'],
+                                dtype=pl.Categorical)
+            self._test_data = pl.DataFrame({
+                'timestamp': idx + 1640995200,  # 2022-01-01 开始
+                'symbol': symbols.gather(idx % 5),
+                'price': 100.0 + cents,
+                'volume': 1000 + (idx % 10000),
+                'bid': 99.99 + cents,
+                'ask': 100.01 + cents
+            })
+        return self._test_data.head(rows)
 
     def benchmark_python_write_read(self, data_sizes):
         """Python 写入读取性能测试"""
         print("🐍 Python 性能测试")
         results = {}
 
+        # 一对writer/reader复用到所有数据量: shm_open/ftruncate/mmap和
+        # 控制块初始化只做一次, 段按最大数据量预分配, 计时区只剩IPC
+        test_name = "python_perf"
+        writer = qadataswap.create_writer(test_name, max(50, max(data_sizes) // 1000))
+        reader = qadataswap.create_reader(test_name)
+
         for size in data_sizes:
             print(f"  测试数据量: {size:,} 行")
-            df = self.create_test_data(size)
-
-            # 写入测试
-            test_name = f"python_perf_{size}"
-            start_time = time.time()
+            # Arrow表在计时区外构建一次; 计时区内只剩IPC本身,
+            # 不再把 to_arrow / from_arrow 的两次全列拷贝算进吞吐量
+            arrow_table = self.create_test_data(size).to_arrow()
+            # 实际载荷字节数来自Arrow缓冲区本身; 行/秒依赖行宽,
+            # 字节/秒才能和内存带宽、其他IPC方案横向对比
+            payload_bytes = arrow_table.get_total_buffer_size()
 
             try:
-                writer = qadataswap.create_writer(test_name, max(50, size // 1000))
-                writer.write_arrow(df.to_arrow())
-                write_time = time.time() - start_time
+                # 预热一轮 (不计时): 首次写入的缺页/懒初始化不进指标
+                writer.write_arrow(arrow_table)
+                reader.read_arrow(10000)
+
+                # 写入测试 (perf_counter_ns单调且纳秒分辨率, 不受NTP
+                # 校时影响; 下限钳到1ns避免亚微秒写入除零)
+                t0 = time.perf_counter_ns()
+                writer.write_arrow(arrow_table)
+                write_ns = max(1, time.perf_counter_ns() - t0)
+                write_time = write_ns / 1e9
 
                 # 读取测试
-                start_time = time.time()
-                reader = qadataswap.create_reader(test_name)
+                t0 = time.perf_counter_ns()
                 result_table = reader.read_arrow(10000)
-                read_time = time.time() - start_time
+                read_ns = max(1, time.perf_counter_ns() - t0)
+                read_time = read_ns / 1e9
 
                 if result_table is not None:
-                    result_df = pl.from_arrow(result_table)
                     throughput_write = size / write_time
                     throughput_read = size / read_time
+                    write_mb_s = payload_bytes / write_time / (1 << 20)
+                    read_mb_s = payload_bytes / read_time / (1 << 20)
 
                     results[size] = {
                         'write_time': write_time,
                         'read_time': read_time,
                         'write_throughput': throughput_write,
                         'read_throughput': throughput_read,
-                        'rows_verified': len(result_df)
+                        'write_mb_s': write_mb_s,
+                        'read_mb_s': read_mb_s,
+                        'payload_mb': payload_bytes / (1 << 20),
+                        'rows_verified': result_table.num_rows
                     }
 
-                    print(f"    写入: {write_time:.4f}s ({throughput_write:,.0f} 行/秒)")
-                    print(f"    读取: {read_time:.4f}s ({throughput_read:,.0f} 行/秒)")
+                    print(f"    写入: {write_time:.4f}s ({throughput_write:,.0f} 行/秒, {write_mb_s:,.1f} MB/s)")
+                    print(f"    读取: {read_time:.4f}s ({throughput_read:,.0f} 行/秒, {read_mb_s:,.1f} MB/s)")
                 else:
                     print(f"    ❌ 读取失败")
 
             except Exception as e:
                 print(f"    ❌ 错误: {e}")
 
+        writer.close()
+        reader.close()
+
         return results
 
     def benchmark_cpp_performance(self, data_sizes):
@@ -92,28 +127,48 @@ class PerformanceBenchmark:
         results = {}
 
         try:
-            for size in [1000, 10000, 100000]:  # C++ 性能测试使用预定义大小
-                print(f"  测试数据量: {size:,} 行")
+            # 二进制内部自跑全部预定义规模, 并为每个规模输出一行JSON;
+            # 只需启动一次, 不再按size重复整个二进制
+            t0 = time.perf_counter_ns()
+            result = subprocess.run([
+                str(self.cpp_examples / 'performance_test')
+            ], capture_output=True, text=True, timeout=60)
 
-                # 运行 C++ 性能测试
-                start_time = time.time()
-                result = subprocess.run([
-                    str(self.cpp_examples / 'performance_test')
-                ], capture_output=True, text=True, timeout=60)
+            total_time = (time.perf_counter_ns() - t0) / 1e9
 
-                total_time = time.time() - start_time
+            if result.returncode == 0:
+                # 逐行解析结构化指标, 不再对整块文本做子串匹配
+                for line in result.stdout.splitlines():
+                    line = line.strip()
+                    if not (line.startswith('{') and line.endswith('}')):
+                        continue
+                    try:
+                        m = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if not all(k in m for k in ('rows', 'write_us', 'read_us')):
+                        continue
+                    rows = m['rows']
+                    write_s = max(m['write_us'], 1) / 1e6
+                    read_s = max(m['read_us'], 1) / 1e6
+                    results[rows] = {
+                        'write_time': write_s,
+                        'read_time': read_s,
+                        'write_throughput': rows / write_s,
+                        'read_throughput': rows / read_s,
+                    }
+                    print(f"    {rows:,} 行: 写入 {write_s:.4f}s, 读取 {read_s:.4f}s")
 
-                if result.returncode == 0:
-                    # 解析输出中的性能数据
-                    output = result.stdout
-                    results[size] = {
+                if not results:
+                    # 老版本二进制没有JSON行: 按原样保留输出
+                    results['raw'] = {
                         'total_time': total_time,
-                        'output': output,
+                        'output': result.stdout,
                         'status': 'success'
                     }
-                    print(f"    完成时间: {total_time:.4f}s")
-                else:
-                    print(f"    ❌ 错误: {result.stderr}")
+                print(f"  完成时间: {total_time:.4f}s")
+            else:
+                print(f"  ❌ 错误: {result.stderr}")
 
         except Exception as e:
             print(f"  ❌ C++ 测试失败: {e}")
@@ -127,12 +182,12 @@ class PerformanceBenchmark:
 
         try:
             # 运行 Rust 性能测试
-            start_time = time.time()
+            t0 = time.perf_counter_ns()
             result = subprocess.run([
                 str(self.rust_examples / 'performance_test')
             ], capture_output=True, text=True, timeout=60)
 
-            total_time = time.time() - start_time
+            total_time = (time.perf_counter_ns() - t0) / 1e9
 
             if result.returncode == 0:
                 # 解析输出中的性能数据
@@ -155,31 +210,35 @@ class PerformanceBenchmark:
         """内存使用测试"""
         print("💾 内存使用测试")
 
-        # 获取当前进程内存使用
-        process = psutil.Process()
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        # ru_maxrss 是内核维护的真实高水位线: 采样点之间的瞬时峰值
+        # (比如 to_arrow 的中间分配) 也被计入, 查询本身不开 /proc
+        def peak_mb():
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB -> MB
+
+        initial_memory = peak_mb()
 
         # 创建大量数据测试内存使用
         df = self.create_test_data(100000)  # 100K 行
-        data_memory = process.memory_info().rss / 1024 / 1024  # MB
+        data_memory = peak_mb()
 
         try:
             # 写入数据
             writer = qadataswap.create_writer("memory_test", 100)
             writer.write_arrow(df.to_arrow())
-            write_memory = process.memory_info().rss / 1024 / 1024  # MB
+            write_memory = peak_mb()
 
             # 读取数据
             reader = qadataswap.create_reader("memory_test")
             result_table = reader.read_arrow(5000)
-            read_memory = process.memory_info().rss / 1024 / 1024  # MB
+            read_memory = peak_mb()
 
             memory_results = {
                 'initial_memory_mb': initial_memory,
                 'data_creation_mb': data_memory,
                 'after_write_mb': write_memory,
                 'after_read_mb': read_memory,
-                'peak_usage_mb': max(data_memory, write_memory, read_memory)
+                # 高水位线单调递增, 最后一次采样即全程峰值
+                'peak_usage_mb': read_memory
             }
 
             print(f"  初始内存: {initial_memory:.2f} MB")
@@ -202,6 +261,9 @@ class PerformanceBenchmark:
 
         data_sizes = [1000, 10000, 50000]  # 测试数据大小
 
+        # 预构建最大规模 (内存测试用到100K行), 各阶段从这一份切片
+        self.create_test_data(max(data_sizes + [100000]))
+
         # Python 性能测试
         print(f"\n{'=' * 80}")
         self.results['python'] = self.benchmark_python_write_read(data_sizes)
@@ -225,11 +287,37 @@ class PerformanceBenchmark:
         self.generate_report()
 
     def save_results(self):
-        """保存测试结果到文件"""
+        """保存测试结果 (Arrow IPC为主, JSON留作人工查看)"""
+        import pyarrow as pa
+
+        # 数值指标拍平成 (language, metric, value) 长表, 用项目自己的
+        # Arrow IPC格式落盘: 类型化列、文件更小、polars可零拷贝读回
+        rows = []
+
+        def flatten(language, key, value):
+            if isinstance(value, dict):
+                for k, v in value.items():
+                    flatten(language, f"{key}/{k}" if key else str(k), v)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                rows.append((language, key, float(value)))
+
+        for language, section in self.results.items():
+            flatten(language, '', section)
+
+        arrow_file = self.project_root / 'benchmark_results.arrow'
+        table = pa.table({
+            'language': [r[0] for r in rows],
+            'metric': [r[1] for r in rows],
+            'value': [r[2] for r in rows],
+        })
+        with pa.OSFile(str(arrow_file), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as ipc_writer:
+                ipc_writer.write_table(table)
+
         results_file = self.project_root / 'benchmark_results.json'
         with open(results_file, 'w') as f:
             json.dump(self.results, f, indent=2)
-        print(f"\n📊 结果已保存到: {results_file}")
+        print(f"\n📊 结果已保存到: {arrow_file} (及 {results_file})")
 
     def generate_report(self):
         """生成性能报告"""
@@ -241,6 +329,16 @@ class PerformanceBenchmark:
         if 'python' in self.results and self.results['python']:
             print("\n🐍 Python 性能:")
             for size, data in self.results['python'].items():
+                print(f"  {size:,} 行 ({data['payload_mb']:.2f} MB):")
+                print(f"    写入吞吐量: {data['write_mb_s']:,.1f} MB/s ({data['write_throughput']:,.0f} 行/秒)")
+                print(f"    读取吞吐量: {data['read_mb_s']:,.1f} MB/s ({data['read_throughput']:,.0f} 行/秒)")
+
+        # C++ 结果总结 (来自性能二进制的结构化JSON行, 可与Python对比)
+        cpp_rows = {k: v for k, v in self.results.get('cpp', {}).items()
+                    if isinstance(v, dict) and 'write_throughput' in v}
+        if cpp_rows:
+            print("\n⚡ C++ 性能:")
+            for size, data in cpp_rows.items():
                 print(f"  {size:,} 行:")
                 print(f"    写入吞吐量: {data['write_throughput']:,.0f} 行/秒")
                 print(f"    读取吞吐量: {data['read_throughput']:,.0f} 行/秒")
@@ -7,16 +7,32 @@ with traditional serialization methods using Polars DataFrames.
 """
 
 import polars as pl
+import gc
+import os
+import tempfile
 import time
+import threading
 import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import numpy as np
-import psutil
+import resource
+import sys
 import pickle
 import json
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+# Monotonic nanosecond timer for every measurement: immune to NTP wall
+# clock steps and precise enough for tens-of-microseconds zero-copy reads
+_now = time.perf_counter_ns
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size in MB (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
 try:
     from qadataswap import SharedDataFrame, SharedDataStream
 except ImportError:
@@ -24,6 +40,92 @@ except ImportError:
     exit(1)
 
 
+def _configure_start_method():
+    """Pick the cheapest multiprocessing start method for this platform.
+
+    'spawn' re-imports polars/numpy/qadataswap in every child, which costs
+    hundreds of milliseconds per process and distorts small benchmarks.
+    Prefer 'fork' (instant, copy-on-write); fall back to 'forkserver' with
+    the heavy modules preloaded once in the server process.
+    """
+    available = mp.get_all_start_methods()
+    if "fork" in available:
+        mp.set_start_method("fork", force=True)
+    elif "forkserver" in available:
+        mp.set_forkserver_preload(["polars", "numpy", "qadataswap"])
+        mp.set_start_method("forkserver", force=True)
+
+
+def _concurrent_writer(shared_name: str, df: pl.DataFrame, ready, num_writes: int) -> float:
+    """Writer side of the concurrent benchmark (module-level so pool workers can import it)"""
+    writer = SharedDataFrame.create_writer(shared_name, size_mb=200)
+    ready.set()  # segment exists; readers may attach now
+    start = _now()
+    for _ in range(num_writes):
+        writer.write(df)
+        time.sleep(0.1)
+    return (_now() - start) * 1e-9
+
+
+def _concurrent_reader(shared_name: str, ready, num_reads: int) -> List[float]:
+    """Reader side of the concurrent benchmark"""
+    ready.wait(timeout=10)  # signalled instead of a guessed sleep
+    reader = SharedDataFrame.create_reader(shared_name)
+    times = []
+    for _ in range(num_reads):
+        start = _now()
+        result = reader.read(timeout_ms=5000)
+        if result is not None:
+            times.append((_now() - start) * 1e-9)
+    return times
+
+
+def _streaming_writer(shared_name: str, df: pl.DataFrame, ready, num_chunks: int) -> float:
+    """Writer side of the streaming benchmark.
+
+    The chunk is built once in the parent and passed in, so the loop body
+    is purely write_chunk — the operation being measured — rather than
+    rebuilding an identical DataFrame every iteration.
+    """
+    writer = SharedDataStream.create_writer(shared_name, size_mb=500, buffer_count=8)
+    ready.set()  # stream exists; reader may attach now
+    total_time = 0
+    for _ in range(num_chunks):
+        start = _now()
+        writer.write_chunk(df)
+        total_time += (_now() - start) * 1e-9
+    writer.finish()
+    return total_time
+
+
+def _streaming_reader(shared_name: str, ready, num_chunks: int) -> tuple:
+    """Reader side of the streaming benchmark"""
+    ready.wait(timeout=10)  # signalled instead of a guessed sleep
+    reader = SharedDataStream.create_reader(shared_name)
+    total_time = 0
+    chunks_read = 0
+    for chunk in reader.iter_chunks():
+        start = _now()
+        # Simulate processing
+        _ = chunk.shape
+        total_time += (_now() - start) * 1e-9
+        chunks_read += 1
+        if chunks_read >= num_chunks:
+            break
+    return total_time, chunks_read
+
+
+def _run_serializer_benchmark(method: str, ipc_path: str) -> "BenchmarkResult":
+    """Run one in-process serializer benchmark in a worker process.
+
+    The input frame is memory-mapped from an IPC file on tmpfs, so each
+    worker borrows the buffers instead of unpickling a potentially
+    multi-hundred-MB frame through the pool's task queue.
+    """
+    df = pl.read_ipc(ipc_path, memory_map=True)
+    return PerformanceBenchmark().run_single_benchmark(method, df)
+
+
 @dataclass
 class BenchmarkResult:
     """Results from a benchmark run"""
@@ -34,6 +136,7 @@ class BenchmarkResult:
     write_time: float
     read_time: float
     total_time: float
+    e2e_time: float
     memory_usage_mb: float
     throughput_mb_s: float
     operations_per_sec: float
@@ -44,133 +147,303 @@ class PerformanceBenchmark:
 
     def __init__(self):
         self.results: List[BenchmarkResult] = []
+        # Suites re-request identical (rows, complexity) frames for every
+        # method; build each combination once and hand back the cached
+        # frame, whose Arrow buffers are shared by all users
+        self._data_cache: Dict[tuple, pl.DataFrame] = {}
+        # estimated_size walks every chunk's buffers, which on a 5M-row
+        # complex frame is real work; memoize it per cached frame
+        self._size_cache: Dict[int, float] = {}
+        # Status lines queued during a sweep; a print to a redirected
+        # stdout can block for milliseconds, so nothing is written
+        # between timed runs (see _flush_notes)
+        self._pending_prints: List[str] = []
+
+    def _note(self, line: str):
+        """Queue a status line instead of printing it mid-measurement"""
+        self._pending_prints.append(line)
+
+    def _flush_notes(self):
+        """Emit queued status lines; called only outside timed regions"""
+        if self._pending_prints:
+            sys.stdout.write("\n".join(self._pending_prints) + "\n")
+            self._pending_prints.clear()
+
+    # Presets expand to column sets; callers keep passing a complexity
+    # string, but generation below is per column, so a run only ever
+    # materializes the columns it asked for
+    _COMPLEXITY_COLUMNS = {
+        "simple": frozenset({"id", "value"}),
+        "medium": frozenset({"id", "price", "volume", "symbol", "is_buy"}),
+        "complex": frozenset({"id", "price", "volume", "symbol", "timestamp",
+                              "description", "metadata", "binary_data"}),
+    }
+
+    # Canonical column order for the generated frames
+    _COLUMN_ORDER = ("id", "value", "price", "volume", "symbol", "is_buy",
+                     "timestamp", "description", "metadata", "binary_data")
+
+    def generate_test_data(self, rows: int, complexity: str = "simple",
+                           columns: Optional[frozenset] = None) -> pl.DataFrame:
+        """Generate test data with the given columns (memoized per shape).
+
+        `complexity` is a preset expanded via _COMPLEXITY_COLUMNS; pass
+        `columns` directly to materialize an arbitrary subset instead.
+        """
+        if columns is None:
+            columns = self._COMPLEXITY_COLUMNS[complexity]
+        key = (rows, frozenset(columns))
+        if key in self._data_cache:
+            return self._data_cache[key]
+
+        # Every column is a lazy expression over one id index — the data
+        # is born in Arrow buffers, with no Python-list intermediates —
+        # and the streaming collect builds only the requested subset, so
+        # the expensive string/struct/binary columns cost nothing when a
+        # suite does not ask for them
+        exprs = {
+            "value": (pl.col("id").cast(pl.Float64) * 1.5).alias("value"),
+            "price": (pl.col("id").cast(pl.Float64) * 1.5 + 100.0).alias("price"),
+            "volume": (pl.col("id") * 10).alias("volume"),
+            # 5-element lookup gathered by id % 5 instead of a
+            # rows-long list-multiply
+            "symbol": pl.lit(pl.Series(["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"]))
+            .gather(pl.col("id") % 5).alias("symbol"),
+            "is_buy": ((pl.col("id") % 2) == 0).alias("is_buy"),
+            # One-minute ticks from 2024-01-01, built as int64
+            # microseconds instead of materializing a full-year
+            # datetime_range and slicing it with head()
+            "timestamp": (pl.col("id") * 60_000_000 + 1_704_067_200_000_000)
+            .cast(pl.Datetime("us")).alias("timestamp"),
+            "description": pl.format("Trade #{} with complex string data", pl.col("id"))
+            .alias("description"),
+            "metadata": pl.struct([
+                pl.col("id").alias("key"),
+                pl.struct([(pl.col("id") * 2).alias("value")]).alias("nested"),
+            ]).alias("metadata"),
+            "binary_data": pl.format("binary_{}", pl.col("id")).cast(pl.Binary)
+            .alias("binary_data"),
+        }
+
+        df = (
+            pl.LazyFrame({"id": pl.arange(0, rows, eager=True)})
+            .with_columns([exprs[name] for name in exprs if name in columns])
+            .select([name for name in self._COLUMN_ORDER if name in columns])
+            .collect(streaming=True)
+        )
+
+        # Guard against silent truncation: a full-year datetime_range
+        # capped at 525600 minutes used to shortchange row counts above
+        # that, so generation now proves it produced exactly `rows`
+        assert df.height == rows, f"generated {df.height} rows, expected {rows}"
+
+        self._data_cache[key] = df
+        return df
+
+    def _df_size_mb(self, df: pl.DataFrame) -> float:
+        """Estimated frame size in MB, computed once per frame.
 
-    def generate_test_data(self, rows: int, complexity: str = "simple") -> pl.DataFrame:
-        """Generate test data with varying complexity"""
-        if complexity == "simple":
-            return pl.DataFrame({
-                "id": pl.arange(0, rows, eager=True),
-                "value": pl.arange(0, rows, eager=True).cast(pl.Float64) * 1.5,
-            })
-        elif complexity == "medium":
-            return pl.DataFrame({
-                "id": pl.arange(0, rows, eager=True),
-                "price": pl.arange(0, rows, eager=True).cast(pl.Float64) * 1.5 + 100.0,
-                "volume": pl.arange(0, rows, eager=True) * 10,
-                "symbol": ["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"] * (rows // 5),
-                "is_buy": [True, False] * (rows // 2),
-            })
-        else:  # complex
-            return pl.DataFrame({
-                "id": pl.arange(0, rows, eager=True),
-                "price": pl.arange(0, rows, eager=True).cast(pl.Float64) * 1.5 + 100.0,
-                "volume": pl.arange(0, rows, eager=True) * 10,
-                "symbol": ["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"] * (rows // 5),
-                "timestamp": pl.datetime_range(
-                    start=pl.datetime(2024, 1, 1),
-                    end=pl.datetime(2024, 12, 31),
-                    interval="1m",
-                    eager=True
-                ).head(rows),
-                "description": [f"Trade #{i} with complex string data" for i in range(rows)],
-                "metadata": [{"key": i, "nested": {"value": i * 2}} for i in range(rows)],
-                "binary_data": [bytes(f"binary_{i}", "utf-8") for i in range(rows)],
-            })
-
-    def benchmark_qadataswap(self, df: pl.DataFrame, shared_name: str) -> tuple[float, float]:
+        Keyed by identity: every frame used here comes out of
+        _data_cache and stays alive for the whole session.
+        """
+        key = id(df)
+        if key not in self._size_cache:
+            self._size_cache[key] = df.estimated_size("mb")
+        return self._size_cache[key]
+
+    def benchmark_qadataswap(self, df: pl.DataFrame, shared_name: str, size_mb: float) -> tuple[float, float, float]:
         """Benchmark QADataSwap zero-copy transfer"""
+        ready = threading.Event()
+        # create_writer splits the segment into buffer_count (3) ring
+        # slots and the whole serialized table must fit one slot, so
+        # provision slots x payload plus header margin — the same sizing
+        # test_complete_version.py uses. A flat 100 MB floor would still
+        # over-map small runs; 16 MB covers the header comfortably
+        writer_size_mb = max(16, int(size_mb * 3) + 8)
 
         def writer_func():
-            writer = SharedDataFrame.create_writer(shared_name, size_mb=max(100, int(df.estimated_size("mb") * 2)))
-            start = time.time()
+            writer = SharedDataFrame.create_writer(shared_name, size_mb=writer_size_mb)
+            ready.set()  # segment exists; the reader may attach now
+            start = _now()
             writer.write(df)
-            return time.time() - start
+            return start, _now()
 
         def reader_func():
-            time.sleep(0.1)  # Ensure writer is ready
+            ready.wait(timeout=10)
             reader = SharedDataFrame.create_reader(shared_name)
-            start = time.time()
+            start = _now()
             result = reader.read(timeout_ms=10000)
-            elapsed = time.time() - start
-            return elapsed, result
+            return start, _now(), result
 
-        write_time = writer_func()
-        read_time, result_df = reader_func()
+        # Writer and reader run concurrently, as in a real producer/consumer
+        # pair; serializing write-then-read on one thread would hide the
+        # overlap that shared memory exists to provide
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            read_future = pool.submit(reader_func)
+            write_start, write_end = writer_func()
+            read_start, read_end, result_df = read_future.result()
 
         if result_df is None:
             raise ValueError("Failed to read data")
 
-        return write_time, read_time
+        write_time = (write_end - write_start) * 1e-9
+        read_time = (read_end - read_start) * 1e-9
+        # Wall-clock span across both sides: what a pipeline actually waits
+        e2e_time = (max(write_end, read_end) - min(write_start, read_start)) * 1e-9
+        return write_time, read_time, e2e_time
 
     def benchmark_polars_ipc(self, df: pl.DataFrame) -> tuple[float, float]:
         """Benchmark Polars IPC serialization"""
         # Write (serialize)
-        start = time.time()
+        start = _now()
         buffer = df.write_ipc(None)
-        write_time = time.time() - start
+        write_time = (_now() - start) * 1e-9
 
         # Read (deserialize)
-        start = time.time()
+        start = _now()
         df_restored = pl.read_ipc(buffer)
-        read_time = time.time() - start
+        read_time = (_now() - start) * 1e-9
+
+        return write_time, read_time
+
+    def _ipc_tmpfile(self) -> str:
+        """Create a temp IPC file path, on tmpfs when available"""
+        # /dev/shm keeps disk I/O out of the measurement, so the numbers
+        # reflect the format and mapping cost, not the storage device
+        tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        fd, path = tempfile.mkstemp(suffix=".arrow", dir=tmp_dir)
+        os.close(fd)
+        return path
+
+    def benchmark_polars_ipc_mmap(self, df: pl.DataFrame) -> tuple[float, float]:
+        """Benchmark Polars IPC through a memory-mapped file"""
+        # File-backed uncompressed IPC is the strongest alternative short
+        # of true shared memory: memory_map=True lets the read borrow the
+        # on-disk column buffers instead of copying them
+        path = self._ipc_tmpfile()
+        try:
+            start = _now()
+            df.write_ipc(path, compression="uncompressed")
+            write_time = (_now() - start) * 1e-9
+
+            start = _now()
+            df_restored = pl.read_ipc(path, memory_map=True)
+            read_time = (_now() - start) * 1e-9
+        finally:
+            os.unlink(path)
+
+        return write_time, read_time
+
+    def benchmark_polars_ipc_scan(self, df: pl.DataFrame) -> tuple[float, float]:
+        """Benchmark lazy scan_ipc with a streaming collect"""
+        path = self._ipc_tmpfile()
+        try:
+            start = _now()
+            df.write_ipc(path, compression="uncompressed")
+            write_time = (_now() - start) * 1e-9
+
+            start = _now()
+            df_restored = pl.scan_ipc(path).collect(streaming=True)
+            read_time = (_now() - start) * 1e-9
+        finally:
+            os.unlink(path)
 
         return write_time, read_time
 
     def benchmark_polars_parquet(self, df: pl.DataFrame) -> tuple[float, float]:
         """Benchmark Polars Parquet serialization"""
         # Write
-        start = time.time()
+        start = _now()
         buffer = df.write_parquet(None)
-        write_time = time.time() - start
+        write_time = (_now() - start) * 1e-9
 
         # Read
-        start = time.time()
+        start = _now()
         df_restored = pl.read_parquet(buffer)
-        read_time = time.time() - start
+        read_time = (_now() - start) * 1e-9
 
         return write_time, read_time
 
     def benchmark_pickle(self, df: pl.DataFrame) -> tuple[float, float]:
         """Benchmark Python pickle serialization"""
+        # Protocol 5 with out-of-band buffers (PEP 574): large column
+        # buffers are handed to the callback instead of being copied into
+        # the pickle byte stream, so pickle competes at its best rather
+        # than its slowest default
+        buffers = []
+
         # Write
-        start = time.time()
-        buffer = pickle.dumps(df)
-        write_time = time.time() - start
+        start = _now()
+        buffer = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL,
+                              buffer_callback=buffers.append)
+        write_time = (_now() - start) * 1e-9
 
         # Read
-        start = time.time()
-        df_restored = pickle.loads(buffer)
-        read_time = time.time() - start
+        start = _now()
+        df_restored = pickle.loads(buffer, buffers=buffers)
+        read_time = (_now() - start) * 1e-9
 
         return write_time, read_time
 
+    def _warm_up(self, methods: List[str]):
+        """Run each method once on a tiny frame, discarding the result.
+
+        First calls pay one-off costs inside Polars (Parquet compressor
+        init, IPC dictionary-encoding setup, lazy imports) that would
+        otherwise be billed to the smallest timed run and flatter the
+        zero-copy path.
+        """
+        warmup_df = self.generate_test_data(1000, "simple")
+        for method in methods:
+            try:
+                self.run_single_benchmark(method, warmup_df, "warmup")
+            except Exception:
+                pass  # a real failure will resurface in the timed run
+
     def run_single_benchmark(self, method: str, df: pl.DataFrame, shared_name: str = None) -> BenchmarkResult:
         """Run a single benchmark"""
-        print(f"Running {method} benchmark...")
-
-        # Measure memory before
-        process = psutil.Process()
-        memory_before = process.memory_info().rss / 1024 / 1024
-
-        # Run benchmark
-        if method == "QADataSwap":
-            write_time, read_time = self.benchmark_qadataswap(df, shared_name or "benchmark")
-        elif method == "Polars IPC":
-            write_time, read_time = self.benchmark_polars_ipc(df)
-        elif method == "Polars Parquet":
-            write_time, read_time = self.benchmark_polars_parquet(df)
-        elif method == "Pickle":
-            write_time, read_time = self.benchmark_pickle(df)
-        else:
-            raise ValueError(f"Unknown method: {method}")
+        self._note(f"Running {method} benchmark...")
+
+        data_size_mb = self._df_size_mb(df)
+
+        # Standard pattern for every timed region in this file: collect
+        # pending garbage now, keep the cyclic collector off while
+        # measuring so it cannot fire mid-run, restore it afterwards
+        gc.collect()
+        gc.disable()
+        try:
+            e2e_time = None
+            if method == "QADataSwap":
+                write_time, read_time, e2e_time = self.benchmark_qadataswap(df, shared_name or "benchmark", data_size_mb)
+            elif method == "Polars IPC":
+                write_time, read_time = self.benchmark_polars_ipc(df)
+            elif method == "Polars IPC mmap":
+                write_time, read_time = self.benchmark_polars_ipc_mmap(df)
+            elif method == "Polars IPC scan":
+                write_time, read_time = self.benchmark_polars_ipc_scan(df)
+            elif method == "Polars Parquet":
+                write_time, read_time = self.benchmark_polars_parquet(df)
+            elif method == "Pickle":
+                write_time, read_time = self.benchmark_pickle(df)
+            else:
+                raise ValueError(f"Unknown method: {method}")
+        finally:
+            gc.enable()
 
         # Measure memory after
-        memory_after = process.memory_info().rss / 1024 / 1024
-        memory_usage = memory_after - memory_before
+        # ru_maxrss is a monotone high-water mark: a before/after delta
+        # collapses to zero for every run after the process has once
+        # peaked higher, so record the absolute per-run peak. Runs in
+        # fresh worker processes (the parallel serializers) report their
+        # own independent peaks, which is where the zero-copy-vs-full-copy
+        # difference actually shows
+        memory_usage = _peak_rss_mb()
 
         # Calculate metrics
-        data_size_mb = df.estimated_size("mb")
         total_time = write_time + read_time
+        if e2e_time is None:
+            # In-process serializers have no overlap: wall clock is the sum
+            e2e_time = total_time
         throughput = data_size_mb / total_time if total_time > 0 else 0
         ops_per_sec = 1.0 / total_time if total_time > 0 else 0
 
@@ -182,6 +455,7 @@ class PerformanceBenchmark:
             write_time=write_time,
             read_time=read_time,
             total_time=total_time,
+            e2e_time=e2e_time,
             memory_usage_mb=memory_usage,
             throughput_mb_s=throughput,
             operations_per_sec=ops_per_sec
@@ -194,19 +468,47 @@ class PerformanceBenchmark:
         print("="*60)
 
         row_counts = [10000, 100000, 1000000, 5000000]
-        methods = ["QADataSwap", "Polars IPC", "Polars Parquet"]
+        methods = ["QADataSwap", "Polars IPC", "Polars IPC mmap",
+                   "Polars IPC scan", "Polars Parquet"]
+
+        self._warm_up(methods)
 
         for rows in row_counts:
-            print(f"\nTesting with {rows:,} rows...")
+            self._note(f"\nTesting with {rows:,} rows...")
             df = self.generate_test_data(rows, "medium")
 
-            for method in methods:
-                try:
-                    result = self.run_single_benchmark(method, df, f"scale_{rows}")
-                    self.results.append(result)
-                    print(f"  {method:15}: {result.total_time:.4f}s ({result.throughput_mb_s:.1f} MB/s)")
-                except Exception as e:
-                    print(f"  {method:15}: FAILED ({e})")
+            # QADataSwap needs a uniquely named, size-fitted shared
+            # segment, so it keeps its serial path in this process
+            try:
+                result = self.run_single_benchmark("QADataSwap", df, f"scale_{rows}")
+                self.results.append(result)
+                self._note(f"  {'QADataSwap':15}: {result.total_time:.4f}s ({result.throughput_mb_s:.1f} MB/s)")
+            except Exception as e:
+                self._note(f"  {'QADataSwap':15}: FAILED ({e})")
+
+            # The serializers share no state with shared memory or each
+            # other; run them on separate cores, each mapping the input
+            # from one tmpfs IPC file written once per size
+            serializer_methods = [m for m in methods if m != "QADataSwap"]
+            ipc_path = self._ipc_tmpfile()
+            df.write_ipc(ipc_path, compression="uncompressed")
+            try:
+                with ProcessPoolExecutor(max_workers=len(serializer_methods)) as pool:
+                    futures = [(m, pool.submit(_run_serializer_benchmark, m, ipc_path))
+                               for m in serializer_methods]
+                    for method, future in futures:
+                        try:
+                            result = future.result()
+                            self.results.append(result)
+                            self._note(f"  {method:15}: {result.total_time:.4f}s ({result.throughput_mb_s:.1f} MB/s)")
+                        except Exception as e:
+                            self._note(f"  {method:15}: FAILED ({e})")
+            finally:
+                os.unlink(ipc_path)
+
+            # All methods for this size are done; now it is safe to touch
+            # stdout without a flush landing inside a measurement
+            self._flush_notes()
 
     def run_complexity_benchmark(self):
         """Benchmark performance with different data complexities"""
@@ -218,17 +520,21 @@ class PerformanceBenchmark:
         rows = 1000000
         methods = ["QADataSwap", "Polars IPC", "Polars Parquet"]
 
+        self._warm_up(methods)
+
         for complexity in complexities:
-            print(f"\nTesting {complexity} data structure...")
+            self._note(f"\nTesting {complexity} data structure...")
             df = self.generate_test_data(rows, complexity)
 
             for method in methods:
                 try:
                     result = self.run_single_benchmark(method, df, f"complex_{complexity}")
                     self.results.append(result)
-                    print(f"  {method:15}: {result.total_time:.4f}s ({result.throughput_mb_s:.1f} MB/s)")
+                    self._note(f"  {method:15}: {result.total_time:.4f}s ({result.throughput_mb_s:.1f} MB/s)")
                 except Exception as e:
-                    print(f"  {method:15}: FAILED ({e})")
+                    self._note(f"  {method:15}: FAILED ({e})")
+
+            self._flush_notes()
 
     def run_concurrent_benchmark(self):
         """Benchmark concurrent read/write performance"""
@@ -243,44 +549,30 @@ class PerformanceBenchmark:
         # Single writer, multiple readers
         num_readers = [1, 2, 4, 8]
 
-        for readers in num_readers:
-            print(f"\nTesting 1 writer + {readers} readers...")
-
-            def writer_process():
-                writer = SharedDataFrame.create_writer(shared_name, size_mb=200)
-                start = time.time()
-                for i in range(5):  # Write 5 times
-                    writer.write(df)
-                    time.sleep(0.1)
-                return time.time() - start
-
-            def reader_process(reader_id):
-                time.sleep(0.2)  # Wait for writer
-                reader = SharedDataFrame.create_reader(shared_name)
-                times = []
-                for i in range(5):
-                    start = time.time()
-                    result = reader.read(timeout_ms=5000)
-                    if result is not None:
-                        times.append(time.time() - start)
-                return times
-
-            # Start processes
-            writer_proc = mp.Process(target=writer_process)
-            reader_procs = [mp.Process(target=reader_process, args=(i,)) for i in range(readers)]
-
-            start_time = time.time()
-            writer_proc.start()
-            for proc in reader_procs:
-                proc.start()
-
-            writer_proc.join()
-            for proc in reader_procs:
-                proc.join()
-
-            total_time = time.time() - start_time
-            print(f"  Total time: {total_time:.4f}s")
-            print(f"  Throughput: {(df.estimated_size('mb') * 5 * readers) / total_time:.1f} MB/s")
+        # One pool for the whole sweep: child interpreters (and their
+        # polars/qadataswap imports) are reused across the reader counts
+        # instead of being forked and torn down per round
+        with mp.Manager() as manager, \
+                ProcessPoolExecutor(max_workers=1 + max(num_readers)) as pool:
+            for readers in num_readers:
+                print(f"\nTesting 1 writer + {readers} readers...")
+
+                ready = manager.Event()
+
+                start_time = _now()
+                writer_future = pool.submit(_concurrent_writer, shared_name, df, ready, 5)
+                reader_futures = [
+                    pool.submit(_concurrent_reader, shared_name, ready, 5)
+                    for _ in range(readers)
+                ]
+
+                writer_future.result()
+                for future in reader_futures:
+                    future.result()
+
+                total_time = (_now() - start_time) * 1e-9
+                print(f"  Total time: {total_time:.4f}s")
+                print(f"  Throughput: {(self._df_size_mb(df) * 5 * readers) / total_time:.1f} MB/s")
 
     def run_streaming_benchmark(self):
         """Benchmark streaming performance"""
@@ -292,45 +584,27 @@ class PerformanceBenchmark:
         num_chunks = 10
         shared_name = "streaming_test"
 
-        def writer_process():
-            writer = SharedDataStream.create_writer(shared_name, size_mb=500, buffer_count=8)
-            total_time = 0
-            for i in range(num_chunks):
-                df = self.generate_test_data(chunk_size, "medium")
-                start = time.time()
-                writer.write_chunk(df)
-                total_time += time.time() - start
-            writer.finish()
-            return total_time
-
-        def reader_process():
-            time.sleep(0.2)  # Wait for writer
-            reader = SharedDataStream.create_reader(shared_name)
-            total_time = 0
-            chunks_read = 0
-            for chunk in reader.iter_chunks():
-                start = time.time()
-                # Simulate processing
-                _ = chunk.shape
-                total_time += time.time() - start
-                chunks_read += 1
-                if chunks_read >= num_chunks:
-                    break
-            return total_time, chunks_read
+        # Build the chunk once in the parent; the writer receives it via
+        # args (COW under fork, pickled once at start otherwise) instead of
+        # regenerating it num_chunks times inside the child
+        df = self.generate_test_data(chunk_size, "medium")
+        ready = mp.Event()
 
         # Run streaming test
-        writer_proc = mp.Process(target=writer_process)
-        reader_proc = mp.Process(target=reader_process)
+        writer_proc = mp.Process(target=_streaming_writer,
+                                 args=(shared_name, df, ready, num_chunks))
+        reader_proc = mp.Process(target=_streaming_reader,
+                                 args=(shared_name, ready, num_chunks))
 
-        start_time = time.time()
+        start_time = _now()
         writer_proc.start()
         reader_proc.start()
 
         writer_proc.join()
         reader_proc.join()
 
-        total_time = time.time() - start_time
-        total_data_mb = self.generate_test_data(chunk_size, "medium").estimated_size("mb") * num_chunks
+        total_time = (_now() - start_time) * 1e-9
+        total_data_mb = self._df_size_mb(df) * num_chunks
 
         print(f"Streamed {num_chunks} chunks of {chunk_size:,} rows each")
         print(f"Total data: {total_data_mb:.1f} MB")
@@ -347,62 +621,67 @@ class PerformanceBenchmark:
             print("No benchmark results available.")
             return
 
-        # Group results by method
-        by_method = {}
-        for result in self.results:
-            if result.method not in by_method:
-                by_method[result.method] = []
-            by_method[result.method].append(result)
+        # One pass into a structured array; every aggregate below is a
+        # vectorized column reduction instead of a fresh generator loop
+        # per statistic
+        arr = np.array(
+            [(r.method, r.total_time, r.throughput_mb_s, r.memory_usage_mb)
+             for r in self.results],
+            dtype=[("method", "U20"), ("t", "f8"), ("tp", "f8"), ("mem", "f8")],
+        )
+        methods, inverse = np.unique(arr["method"], return_inverse=True)
+        counts = np.bincount(inverse)
+        avg_time = np.bincount(inverse, weights=arr["t"]) / counts
+        avg_throughput = np.bincount(inverse, weights=arr["tp"]) / counts
+        avg_memory = np.bincount(inverse, weights=arr["mem"]) / counts
 
-        # Print summary table
-        print(f"{'Method':<15} {'Avg Time (s)':<12} {'Avg Throughput (MB/s)':<20} {'Tests':<6}")
-        print("-" * 60)
+        # Print summary table (percentiles say more than the mean for latency)
+        print(f"{'Method':<15} {'Avg Time (s)':<12} {'P50 (s)':<10} {'P95 (s)':<10} {'Avg Throughput (MB/s)':<20} {'Tests':<6}")
+        print("-" * 80)
 
-        for method, results in by_method.items():
-            avg_time = sum(r.total_time for r in results) / len(results)
-            avg_throughput = sum(r.throughput_mb_s for r in results) / len(results)
-            count = len(results)
-            print(f"{method:<15} {avg_time:<12.4f} {avg_throughput:<20.1f} {count:<6}")
+        for i, method in enumerate(methods):
+            p50, p95 = np.percentile(arr["t"][inverse == i], [50, 95])
+            print(f"{method:<15} {avg_time[i]:<12.4f} {p50:<10.4f} {p95:<10.4f} "
+                  f"{avg_throughput[i]:<20.1f} {counts[i]:<6}")
 
         # Find best performing method
-        if "QADataSwap" in by_method:
-            qads_results = by_method["QADataSwap"]
-            qads_avg_time = sum(r.total_time for r in qads_results) / len(qads_results)
+        if "QADataSwap" in methods:
+            qads_avg_time = avg_time[methods == "QADataSwap"][0]
 
             print(f"\nSpeedup over other methods:")
-            for method, results in by_method.items():
+            for i, method in enumerate(methods):
                 if method != "QADataSwap":
-                    avg_time = sum(r.total_time for r in results) / len(results)
-                    speedup = avg_time / qads_avg_time if qads_avg_time > 0 else float('inf')
+                    speedup = avg_time[i] / qads_avg_time if qads_avg_time > 0 else float('inf')
                     print(f"  vs {method}: {speedup:.1f}x faster")
 
         # Memory efficiency
         print(f"\nMemory Usage Summary:")
-        for method, results in by_method.items():
-            avg_memory = sum(r.memory_usage_mb for r in results) / len(results)
-            print(f"  {method}: {avg_memory:.1f} MB average")
+        for i, method in enumerate(methods):
+            print(f"  {method}: {avg_memory[i]:.1f} MB average peak RSS")
 
     def save_results(self, filename: str = "benchmark_results.json"):
-        """Save results to JSON file"""
-        data = []
-        for result in self.results:
-            data.append({
-                "method": result.method,
-                "data_size_mb": result.data_size_mb,
-                "rows": result.rows,
-                "cols": result.cols,
-                "write_time": result.write_time,
-                "read_time": result.read_time,
-                "total_time": result.total_time,
-                "memory_usage_mb": result.memory_usage_mb,
-                "throughput_mb_s": result.throughput_mb_s,
-                "operations_per_sec": result.operations_per_sec,
-            })
-
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
-
-        print(f"\nResults saved to {filename}")
+        """Save results to JSON (human-readable) and Parquet (analysis)"""
+        records = [asdict(result) for result in self.results]
+
+        # orjson serializes dataclasses natively and emits bytes about an
+        # order of magnitude faster than stdlib json for float-heavy
+        # records; fall back to json when it is not installed
+        try:
+            import orjson
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        except ImportError:
+            with open(filename, 'w') as f:
+                json.dump(records, f, indent=2)
+
+        # Columnar copy: zstd Parquet is a fraction of the JSON size and
+        # lets multi-run comparisons go straight through
+        # pl.scan_parquet(...).group_by("method") with no JSON munging
+        parquet_path = str(Path(filename).with_suffix(".parquet"))
+        pl.DataFrame(records).write_parquet(
+            parquet_path, compression="zstd", compression_level=3)
+
+        print(f"\nResults saved to {filename} and {parquet_path}")
 
 
 def main():
@@ -410,6 +689,8 @@ def main():
     print("QADataSwap Python Performance Benchmark")
     print("="*50)
 
+    _configure_start_method()
+
     benchmark = PerformanceBenchmark()
 
     try: